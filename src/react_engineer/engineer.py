@@ -3,8 +3,10 @@ import os
 import json
 import argparse
 import logging
+import re
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import openai
 from dotenv import load_dotenv
@@ -31,6 +33,164 @@ class SandboxError(BaseModel):
     std_err: str
 
 
+class BuildError(BaseModel):
+    """Compact description of the first fatal error seen in a build log."""
+
+    command: str
+    kind: str
+    message: str
+    location: Optional[str] = None
+    excerpt: List[str] = []
+
+    def __str__(self) -> str:
+        lines = [f"`{self.command}` failed ({self.kind}): {self.message}"]
+        if self.location:
+            lines.append(f"Location: {self.location}")
+        if self.excerpt:
+            lines.append("Log excerpt:")
+            lines.extend(self.excerpt)
+        return "\n".join(lines)
+
+
+class BuildLogAnalyzer:
+    """
+    Watches streamed npm / react-scripts / webpack output and recognizes the
+    first fatal error as soon as it is printed.
+
+    Output is fed chunk by chunk through `feed`, which can be passed directly as
+    an `on_stdout` / `on_stderr` callback. Once a fatal line is matched, up to
+    `context_lines` following lines are collected into the excerpt and
+    `on_fatal` is called so the caller can kill the command.
+    """
+
+    # (kind, pattern) pairs, checked in order against every complete line.
+    # Anchored to the line shapes react-scripts / webpack / babel print, so
+    # unrelated output (e.g. npm lifecycle scripts) doesn't trigger an abort.
+    FATAL_PATTERNS = [
+        ("module_not_found", re.compile(r"^Module not found: (?:Error: )?(.*)")),
+        (
+            "module_not_found",
+            re.compile(r"^(?:Error: )?(Cannot find module '[^']+'.*)"),
+        ),
+        (
+            "syntax_error",
+            re.compile(r"^SyntaxError: (\S*src/\S+\.(?:jsx?|tsx?): .*)"),
+        ),
+        ("import_error", re.compile(r"^Attempted import error: (.*)")),
+        ("type_error", re.compile(r"^(TS\d+: .*)")),
+        ("webpack_error", re.compile(r"^ERROR in (.*)")),
+        ("compile_failed", re.compile(r"^(Failed to compile\.?)")),
+        ("npm_error", re.compile(r"^npm (?:ERR!|error) (.*)")),
+    ]
+    # Kinds that only announce an error; the concrete cause follows them
+    HEADER_KINDS = {"compile_failed", "webpack_error"}
+    # Source locations as printed by babel / webpack, e.g. "./src/App.js 12:4"
+    # or "/home/user/react-app/src/App.js: Unexpected token (12:4)"
+    LOCATION_PATTERN = re.compile(
+        r"(\.?/?[\w./-]*src/[\w./-]+\.(?:jsx?|tsx?|css))(?:.*?(\d+:\d+))?"
+    )
+    ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+    def __init__(
+        self,
+        command: str,
+        context_lines: int = 12,
+        on_fatal: Optional[Callable[[BuildError], None]] = None,
+    ):
+        """
+        Initialize the build log analyzer.
+
+        Args:
+            command: Command whose output is analyzed (used in the error report)
+            context_lines: Number of lines after the fatal one to keep in the excerpt
+            on_fatal: Callback invoked once the error excerpt is complete
+        """
+        self.command = command
+        self.context_lines = context_lines
+        self.on_fatal = on_fatal
+        self.error: Optional[BuildError] = None
+        self._buffer = ""
+        self._lock = threading.Lock()
+        self._notified = False
+
+    def feed(self, chunk: str):
+        """Consume a chunk of streamed output, which may contain partial lines."""
+        with self._lock:
+            self._buffer += chunk
+            *lines, self._buffer = self._buffer.split("\n")
+            for line in lines:
+                self._process_line(line)
+
+        if self.done:
+            self._notify()
+
+    def flush(self):
+        """Process any trailing output that did not end with a newline."""
+        with self._lock:
+            if self._buffer:
+                self._process_line(self._buffer)
+                self._buffer = ""
+
+    @property
+    def done(self) -> bool:
+        """Whether a fatal error was found and its excerpt is complete."""
+        return (
+            self.error is not None
+            and len(self.error.excerpt) > self.context_lines
+        )
+
+    def _notify(self):
+        if self._notified or self.on_fatal is None:
+            return
+        self._notified = True
+        self.on_fatal(self.error)
+
+    def _process_line(self, raw_line: str):
+        line = self.ANSI_PATTERN.sub("", raw_line).rstrip()
+        if not line.strip():
+            return
+
+        if self.error is not None:
+            if self.done:
+                return
+            self.error.excerpt.append(line)
+            # Headers like "Failed to compile." are replaced by the concrete cause
+            if self.error.kind in self.HEADER_KINDS:
+                kind, message = self._match(line)
+                if kind and kind not in self.HEADER_KINDS:
+                    self.error.kind = kind
+                    self.error.message = message
+            if self.error.location is None:
+                self.error.location = self._find_location(line)
+            return
+
+        kind, message = self._match(line)
+        if kind is None:
+            return
+
+        self.error = BuildError(
+            command=self.command,
+            kind=kind,
+            message=message,
+            location=self._find_location(line),
+            excerpt=[line],
+        )
+
+    def _match(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        for kind, pattern in self.FATAL_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                return kind, match.group(1).strip()
+        return None, None
+
+    def _find_location(self, line: str) -> Optional[str]:
+        match = self.LOCATION_PATTERN.search(line)
+        if not match:
+            return None
+        path, position = match.groups()
+        return f"{path}:{position}" if position else path
+
+
 class ReactGPTEngineer:
     """
     ReactGPTEngineer generates simple React applications based on detailed prompts
@@ -254,19 +414,89 @@ class ReactGPTEngineer:
 
         # Run npm install
         logger.info("Installing dependencies in sandbox...")
-        try:
-            sandbox.commands.run("cd react-app && npm install", timeout=timeout)
-        except Exception as e:
-            return str(e)
+        # npm only prints its errors right before exiting, so don't abort early
+        error = self._run_build_command(
+            sandbox, "cd react-app && npm install", timeout=timeout, abort_early=False
+        )
+        if error is not None:
+            return error
 
         # Run npm build
         logger.info("Building the React app...")
+        error = self._run_build_command(
+            sandbox, "cd react-app && npm run build", timeout=timeout
+        )
+        if error is not None:
+            return error
+
+        return sandbox
+
+    def _run_build_command(
+        self,
+        sandbox: Sandbox,
+        command: str,
+        timeout: int = 600,
+        kill_grace_period: float = 2.0,
+        abort_early: bool = True,
+    ) -> str | None:
+        """
+        Run a build command in the sandbox, streaming its output into a
+        BuildLogAnalyzer and killing the command on the first fatal error.
+
+        Args:
+            sandbox: Sandbox to run the command in
+            command: Shell command to run
+            timeout: Maximum time (seconds) the command may run
+            kill_grace_period: Seconds to keep collecting error context before
+                killing the command
+            abort_early: Whether to kill the command on the first fatal error
+                instead of letting it exit on its own
+
+        Returns:
+            Compact error report if the command failed, else None.
+        """
+        handle = None
+        kill_lock = threading.Lock()
+        killed = False
+
+        def kill(*_):
+            nonlocal killed
+            with kill_lock:
+                if killed:
+                    return
+                killed = True
+            logger.warning(f"Fatal error detected, aborting `{command}`...")
+            try:
+                if handle is not None:
+                    handle.kill()
+            except Exception as e:
+                logger.debug(f"Failed to kill `{command}`: {e}")
+
+        analyzer = BuildLogAnalyzer(command, on_fatal=kill if abort_early else None)
+        kill_timer = None
+
+        def on_output(chunk: str):
+            nonlocal kill_timer
+            analyzer.feed(chunk)
+            # Don't wait forever for the remaining context lines
+            if abort_early and analyzer.error is not None and kill_timer is None:
+                kill_timer = threading.Timer(kill_grace_period, kill)
+                kill_timer.daemon = True
+                kill_timer.start()
+
         try:
-            sandbox.commands.run("cd react-app && npm run build", timeout=timeout)
+            handle = sandbox.commands.run(command, background=True, timeout=timeout)
+            handle.wait(on_stdout=on_output, on_stderr=on_output)
         except Exception as e:
+            analyzer.flush()
+            if analyzer.error is not None:
+                return str(analyzer.error)
             return str(e)
+        finally:
+            if kill_timer is not None:
+                kill_timer.cancel()
 
-        return sandbox
+        return None
 
     def iterate_with_feedback(self, test_results: str) -> Dict[str, str]:
         """